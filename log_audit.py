@@ -4,67 +4,138 @@ import argparse
 import sys
 import time
 import json
-from typing import Any, Dict, List
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from eth_hash.auto import keccak
 from web3 import Web3
 
 DEFAULT_RPC_A = os.getenv("RPC_A", "https://mainnet.infura.io/v3/your_api_key")
 DEFAULT_RPC_B = os.getenv("RPC_B", "https://eth.llamarpc.com")
 
+SHARD_BLOCKS = 1000      # blocks per eth_getLogs request
+FETCH_WORKERS = 8        # concurrent shard requests per provider
+MAX_RETRIES = 4          # retries per shard on 429 / timeout
+BACKOFF_BASE_S = 0.5     # first retry delay, doubled on each attempt
+
 def connect(url: str) -> Web3:
+    if " " in url: print(f"⚠️ RPC URL contains whitespace: {url}")
     w3 = Web3(Web3.HTTPProvider(url, request_kwargs={"timeout": 20}))
     if not w3.is_connected():
         print(f"❌ Failed to connect: {url}")
         sys.exit(1)
     return w3
 
-def connect(url: str) -> Web3:
-    if " " in url: print(f"⚠️ RPC URL contains whitespace: {url}")
-    w3 = Web3(Web3.HTTPProvider(url, request_kwargs={"timeout": 20}))
-
-def keccak_json(obj: Any) -> str:
-    data = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
-    return "0x" + Web3.keccak(data).hex()
-
-def canonical_log(log: Dict[str, Any]) -> Dict[str, Any]:
+class CanonicalLog(NamedTuple):
+    """A log reduced to its deterministic fields. Plain tuple equality and
+    ordering, no per-field dict lookups."""
+    address: Any
+    blockNumber: int
+    transactionHash: Any
+    transactionIndex: int
+    logIndex: int
+    data: Any
+    topics: Tuple[Any, ...]
+
+def log_json(log: CanonicalLog) -> bytes:
+    """Compact, key-sorted JSON of one log."""
+    return json.dumps(log._asdict(), sort_keys=True, separators=(",", ":")).encode()
+
+def keccak_logs(logs: List[CanonicalLog], memo: Optional[Dict[CanonicalLog, bytes]] = None) -> str:
+    """Keccak-256 of the logs as a compact, key-sorted JSON array, fed to
+    Keccak one log at a time instead of serializing the whole list.
+    Pass the same `memo` dict when hashing several lists that share logs."""
+    h = keccak.new(b"[")
+    for i, log in enumerate(logs):
+        if i:
+            h.update(b",")
+        if memo is None:
+            h.update(log_json(log))
+            continue
+        encoded = memo.get(log)
+        if encoded is None:
+            encoded = memo[log] = log_json(log)
+        h.update(encoded)
+    h.update(b"]")
+    return "0x" + h.digest().hex()
+
+def _hex(value: Any) -> Any:
+    """web3 returns hashes, data and topics as HexBytes; keep them as 0x strings
+    so logs compare and serialize the same across web3 versions."""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    return value
+
+def canonical_log(log: Dict[str, Any]) -> CanonicalLog:
     """Strip non-deterministic keys and normalize types."""
-    keep = {
-        "address": log.get("address"),
-        "blockNumber": int(log.get("blockNumber", 0)),
-        "transactionHash": log.get("transactionHash"),
-        "transactionIndex": int(log.get("transactionIndex", 0)),
-        "logIndex": int(log.get("logIndex", 0)),
-        "data": log.get("data"),
-        "topics": list(log.get("topics", [])),
-    }
-    return keep
+    return CanonicalLog(
+        log.get("address"),
+        int(log.get("blockNumber", 0)),
+        _hex(log.get("transactionHash")),
+        int(log.get("transactionIndex", 0)),
+        int(log.get("logIndex", 0)),
+        _hex(log.get("data")),
+        tuple(_hex(t) for t in log.get("topics", [])),
+    )
 
-def fetch_logs(w3: Web3, from_block: int, to_block: int, address: str, topic0: str) -> List[Dict[str, Any]]:
-    flt: Dict[str, Any] = {
-        "fromBlock": from_block,
-        "toBlock": to_block,
-    }
+def _is_retryable(e: Exception) -> bool:
+    """HTTP 429, a provider's rate-limit error, or a request timeout."""
+    if isinstance(e, (requests.exceptions.Timeout, TimeoutError)):
+        return True
+    if getattr(getattr(e, "response", None), "status_code", None) == 429:
+        return True
+    msg = str(e).lower()
+    return "rate limit" in msg or "too many requests" in msg
+
+def _get_logs_with_backoff(w3: Web3, flt: Dict[str, Any]) -> List[Dict[str, Any]]:
+    delay = BACKOFF_BASE_S
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return w3.eth.get_logs(flt)
+        except Exception as e:
+            if not _is_retryable(e) or attempt == MAX_RETRIES:
+                raise
+            time.sleep(delay)
+            delay *= 2
+    return []
+
+def fetch_logs(w3: Web3, from_block: int, to_block: int, address: str, topic0: str,
+               shard: int = SHARD_BLOCKS) -> List[CanonicalLog]:
+    base: Dict[str, Any] = {}
     if address != "*":
-        flt["address"] = Web3.to_checksum_address(address)
+        base["address"] = Web3.to_checksum_address(address)
     if topic0 != "*":
-        flt["topics"] = [topic0]
+        base["topics"] = [topic0]
+
+    # Providers cap or reject wide getLogs ranges; page the range into shards
+    # and fetch them concurrently.
+    shards = [(lo, min(lo + shard - 1, to_block)) for lo in range(from_block, to_block + 1, shard)]
+
+    def fetch_shard(bounds):
+        lo, hi = bounds
+        return _get_logs_with_backoff(w3, {**base, "fromBlock": lo, "toBlock": hi})
 
-    time.sleep(0.05)
     try:
-        logs = w3.eth.get_logs(flt)
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+            parts = list(ex.map(fetch_shard, shards))
     except Exception as e:
-        if "429" in str(e) or "rate" in str(e).lower(): time.sleep(1.0)
         print(f"⚠️ get_logs error on {w3.provider.endpoint_uri}: {e}")
         return []
-        logs = [canonical_log(l) for l in logs]
-        logs.sort(key=lambda l: (l["blockNumber"], l["transactionIndex"], l["logIndex"]))
-        return logs
 
-def compare_logs(logs_a: List[Dict[str, Any]], logs_b: List[Dict[str, Any]]):
+    logs = [canonical_log(l) for part in parts for l in part]
+    logs.sort(key=lambda l: (l[1], l[3], l[4]))  # blockNumber, transactionIndex, logIndex
+    return logs
+
+def compare_logs(logs_a: List[CanonicalLog], logs_b: List[CanonicalLog]):
+    # Tuple lists compare in C and stop at a length mismatch or the first
+    # differing log; no hash pre-check can beat that.
     if logs_a == logs_b:
         return True, None
 
-    root_a = keccak_json(logs_a)
-    root_b = keccak_json(logs_b)
+    # Logs both providers returned are serialized once.
+    memo: Dict[CanonicalLog, bytes] = {}
+    root_a = keccak_logs(logs_a, memo)
+    root_b = keccak_logs(logs_b, memo)
 
     len_a = len(logs_a)
     len_b = len(logs_b)
@@ -74,7 +145,7 @@ def compare_logs(logs_a: List[Dict[str, Any]], logs_b: List[Dict[str, Any]]):
     if len_a == len_b:
         for i, (la, lb) in enumerate(zip(logs_a, logs_b)):
             if la != lb:
-                first_diff = {"index": i, "a": la, "b": lb}
+                first_diff = {"index": i, "a": la._asdict(), "b": lb._asdict()}
                 break
 
     return False, {
@@ -110,15 +181,8 @@ def main():
     rpcA = args.rpcA
     rpcB = args.rpcB
 
-
-    from_block = int(sys.argv[1])
-    to_block = int(sys.argv[2])
-    address = sys.argv[3]
-        if address != "*" and not Web3.is_address(address): print("❌ Invalid address format."); sys.exit(2)
-    topic0 = sys.argv[4]
-        if topic0 != "*" and (not topic0.startswith("0x") or len(topic0) != 66): print("⚠️ topic0 looks malformed — expected 0x + 64 hex.")
-    rpcA = sys.argv[5] if len(sys.argv) > 5 else DEFAULT_RPC_A
-    rpcB = sys.argv[6] if len(sys.argv) > 6 else DEFAULT_RPC_B
+    if address != "*" and not Web3.is_address(address): print("❌ Invalid address format."); sys.exit(2)
+    if topic0 != "*" and (not topic0.startswith("0x") or len(topic0) != 66): print("⚠️ topic0 looks malformed — expected 0x + 64 hex.")
 
     if from_block < 0 or to_block < 0:
         print("❌ Blocks must be ≥ 0.")
@@ -127,7 +191,7 @@ def main():
     if from_block > to_block:
         from_block, to_block = to_block, from_block
         print("🔄 Swapped block range for ascending order.")
-            if to_block - from_block > 200_000: print("⚠️ Large block range — some providers may refuse or rate-limit getLogs.")
+    if to_block - from_block > 200_000: print("⚠️ Large block range — some providers may refuse or rate-limit getLogs.")
 
     if rpcA == rpcB:
         print("⚠️ rpcA and rpcB are identical — comparison may be meaningless.")
@@ -137,7 +201,7 @@ def main():
 
     wA = connect(rpcA)
     wB = connect(rpcB)
-        tip = wA.eth.block_number
+    tip = wA.eth.block_number
     if to_block > tip: print(f"⚠️ toBlock {to_block} > tip {tip} on RPC A; clamping."); to_block = tip
 
     print(f"🌐 RPC A: {rpcA} (chainId={wA.eth.chain_id})")
@@ -148,8 +212,11 @@ def main():
 
     print(f"🔍 Fetching logs from blocks [{from_block}, {to_block}]…")
     t0 = time.monotonic()
-    logs_a = fetch_logs(wA, from_block, to_block, address, topic0)
-    logs_b = fetch_logs(wB, from_block, to_block, address, topic0)
+    # Independent endpoints: fetch both concurrently.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_a = ex.submit(fetch_logs, wA, from_block, to_block, address, topic0)
+        fut_b = ex.submit(fetch_logs, wB, from_block, to_block, address, topic0)
+        logs_a, logs_b = fut_a.result(), fut_b.result()
     elapsed = time.monotonic() - t0
 
     print(f"📦 RPC A logs: {len(logs_a)}")
@@ -158,7 +225,7 @@ def main():
     ok, diff = compare_logs(logs_a, logs_b)
 
     if ok:
-        root_logs = keccak_json(logs_a)
+        root_logs = keccak_logs(logs_a)
         print("✅ Logs match exactly across both providers.")
         print(f"🔏 Log set root: {root_logs}")
     else:
@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import os
 import pathlib
+import shlex
 import subprocess
 import sys
+from typing import Optional, Tuple
 
 
-def main() -> None:
+# Read once at import; main() may be called repeatedly in-process.
+_ENV_RPC_A = os.environ.get("LOG_RPC_A")
+_ENV_RPC_B = os.environ.get("LOG_RPC_B")
+
+_REPO_DIR = pathlib.Path(__file__).resolve().parent
+_LOG_AUDIT_PATH = _REPO_DIR / "log_audit.py"
+_LOG_AUDIT_OK = _LOG_AUDIT_PATH.is_file()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Quick wrapper around log_audit.py with env-based RPC defaults."
     )
@@ -38,16 +50,38 @@ def main() -> None:
         "--topic0",
         help="Optional topic0 to filter logs.",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not echo the log_audit.py command line to stderr.",
+    )
+    parser.add_argument(
+        "--spawn",
+        action="store_true",
+        help="Run log_audit.py in its own interpreter instead of in-process.",
+    )
     parser.add_argument(
         "extra",
         nargs=argparse.REMAINDER,
         help="Any extra args to pass through to log_audit.py unchanged.",
     )
+    return parser
+
+
+_PARSER = _build_parser()
 
-    args = parser.parse_args()
 
-    rpc_a = args.rpc_a or os.getenv("LOG_RPC_A")
-    rpc_b = args.rpc_b or os.getenv("LOG_RPC_B")
+@functools.lru_cache(maxsize=1)
+def _resolved_rpcs(
+    cli_a: Optional[str], cli_b: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    return cli_a or _ENV_RPC_A, cli_b or _ENV_RPC_B
+
+
+def main() -> None:
+    args = _PARSER.parse_args()
+
+    rpc_a, rpc_b = _resolved_rpcs(args.rpc_a, args.rpc_b)
 
     if not rpc_a or not rpc_b:
         print(
@@ -57,37 +91,55 @@ def main() -> None:
         )
         sys.exit(1)
 
-    repo_dir = pathlib.Path(__file__).resolve().parent
-    log_audit_path = repo_dir / "log_audit.py"
-
-    if not log_audit_path.is_file():
+    if not _LOG_AUDIT_OK:
         print(f"ERROR: log_audit.py not found next to {__file__}", file=sys.stderr)
         sys.exit(1)
 
+    # log_audit.py takes the block range and filters positionally ('*' = any);
+    # extra args are forwarded unchanged.
     cmd = [
         sys.executable,
-        str(log_audit_path),
-        "--rpc-a",
-        rpc_a,
-        "--rpc-b",
-        rpc_b,
-        "--from-block",
+        str(_LOG_AUDIT_PATH),
         str(args.from_block),
-        "--to-block",
         str(args.to_block),
+        args.address or "*",
+        args.topic0 or "*",
+        "--rpcA",
+        rpc_a,
+        "--rpcB",
+        rpc_b,
+        *args.extra,
     ]
 
-    if args.address:
-        cmd += ["--address", args.address]
-    if args.topic0:
-        cmd += ["--topic0", args.topic0]
+    # The command echo is only built for interactive runs, in a single write.
+    if not args.quiet and sys.stderr.isatty():
+        sys.stderr.write(">> Running: " + shlex.join(cmd) + "\n")
+
+    if not args.spawn:
+        # Same argv as the spawned run, but without a second interpreter
+        # startup. SystemExit raised by log_audit.main() propagates as-is.
+        if str(_REPO_DIR) not in sys.path:
+            sys.path.insert(0, str(_REPO_DIR))
+        import log_audit
+
+        saved_argv = sys.argv
+        sys.argv = cmd[1:]
+        try:
+            log_audit.main()
+        finally:
+            sys.argv = saved_argv
+        sys.exit(0)
 
-    # Forward any extra args (e.g. --json, --keccak-only, etc.)
-    cmd += args.extra
+    if os.name == "nt":
+        # exec* on Windows spawns a new process anyway and returns early;
+        # keep waiting on the child so the exit code is propagated.
+        result = subprocess.run(cmd)
+        sys.exit(result.returncode)
 
-    print(">> Running:", " ".join(cmd), file=sys.stderr)
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    # Replace this process instead of forking a child and waiting on it.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, cmd)
 
 
 if __name__ == "__main__":
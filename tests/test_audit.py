@@ -0,0 +1,127 @@
+"""
+Tests for the per-ID audit: the plain loop, the array kernel (pure Python
+and numba-compiled) and the streaming audit must all report the same
+inconsistencies.
+"""
+import importlib.util
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import consistency_audit_cli as cli  # noqa: E402
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+ALLOWED = "NEW>QUEUED>RUNNING>DONE"
+STATES = ["NEW", "QUEUED", "RUNNING", "DONE", "BOGUS"]
+
+
+def make_records(seed, n_ids, n_events, shuffle=False):
+    rng = random.Random(seed)
+    records = []
+    for line_no in range(1, n_events + 1):
+        ts = None
+        if rng.random() > 0.05:
+            ts = f"2024-01-01 00:{rng.randrange(60):02d}:{rng.randrange(60):02d}"
+        records.append(
+            ("a.log", line_no, f"id{rng.randrange(n_ids)}", rng.choice(STATES), ts, f"line {line_no}")
+        )
+    if not shuffle:
+        # Time-ordered per ID, as a single writer would produce.
+        records.sort(key=lambda r: (r[4] or "", r[1]))
+        records = [r[:1] + (i,) + r[2:] for i, r in enumerate(records, start=1)]
+    return records
+
+
+def summarize(inconsistencies):
+    return [
+        (inc.id_value, inc.type, inc.message, [(ev.line_no, ev.state, ev.timestamp) for ev in inc.events])
+        for inc in inconsistencies
+    ]
+
+
+class AuditTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.order_map, self.allowed = cli.build_state_order(ALLOWED)
+
+    def audit_with_kernel(self, table, kernel, ignore_duplicates):
+        rank = cli.state_ranks(table, self.order_map, len(self.allowed))
+        out = []
+        for id_value, events in table.by_id.items():
+            out.extend(
+                cli.audit_id_sequence(
+                    id_value, events, table, self.order_map, self.allowed, ignore_duplicates,
+                    rank, kernel,
+                )
+            )
+        return summarize(out)
+
+    def test_kernel_matches_plain_loop(self) -> None:
+        for seed, ignore_duplicates in [(1, False), (2, True), (3, False)]:
+            with self.subTest(seed=seed, ignore_duplicates=ignore_duplicates):
+                records = make_records(seed, n_ids=5, n_events=2000, shuffle=True)
+                table = cli.collect_events(records, "auto", None, None)
+                expected = self.audit_with_kernel(table, None, ignore_duplicates)
+                self.assertTrue(expected)
+                got = self.audit_with_kernel(table, cli._audit_kernel, ignore_duplicates)
+                self.assertEqual(got, expected)
+
+    def test_kernel_disagreement_raises(self) -> None:
+        def flag_everything(order_idx, n_known, ignore_duplicates, kinds, prev_idx):
+            for j in range(len(kinds)):
+                kinds[j] = 1
+                prev_idx[j] = -1
+
+        records = [("a.log", n, "id0", "NEW", None, "") for n in range(1, cli._KERNEL_MIN_EVENTS + 1)]
+        table = cli.collect_events(records, "auto", None, None)
+        with self.assertRaises(RuntimeError):
+            self.audit_with_kernel(table, flag_everything, True)
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_jit_kernel_matches_plain_loop(self) -> None:
+        for seed, ignore_duplicates in [(1, False), (2, True)]:
+            with self.subTest(seed=seed, ignore_duplicates=ignore_duplicates):
+                records = make_records(seed, n_ids=5, n_events=2000, shuffle=True)
+                table = cli.collect_events(records, "auto", None, None)
+                expected = self.audit_with_kernel(table, None, ignore_duplicates)
+                got = summarize(
+                    cli.audit_all_ids(table, self.order_map, self.allowed, ignore_duplicates, jit=True)
+                )
+                self.assertEqual(got, expected)
+
+    def test_streaming_matches_batched(self) -> None:
+        cases = [
+            (make_records(4, n_ids=50, n_events=3000), None, None),
+            (make_records(5, n_ids=50, n_events=3000, shuffle=True), None, None),
+            (make_records(6, n_ids=50, n_events=3000, shuffle=True), 20, 10),
+        ]
+        for records, max_ids, max_events_per_id in cases:
+            with self.subTest(max_ids=max_ids, max_events_per_id=max_events_per_id):
+                table = cli.collect_events(records, "auto", max_ids, max_events_per_id)
+                expected = summarize(cli.audit_all_ids(table, self.order_map, self.allowed, False))
+
+                incs, total_ids, total_events = cli.audit_streaming(
+                    lambda: iter(records), self.order_map, self.allowed, False, "auto", max_ids, max_events_per_id
+                )
+                self.assertEqual(summarize(incs), expected)
+                self.assertEqual((total_ids, total_events), (len(table), table.total_events()))
+
+    def test_streaming_second_pass_ignores_appended_lines(self) -> None:
+        records = make_records(7, n_ids=10, n_events=500, shuffle=True)
+        appended = [("a.log", 501 + i, "id0", "BOGUS", None, "late") for i in range(5)]
+        reads = iter([records, records + appended])
+
+        incs, _, total_events = cli.audit_streaming(
+            lambda: next(reads), self.order_map, self.allowed, False, "auto", None, None
+        )
+        table = cli.collect_events(records, "auto", None, None)
+        expected = summarize(cli.audit_all_ids(table, self.order_map, self.allowed, False))
+        self.assertEqual(summarize(incs), expected)
+        self.assertEqual(total_events, len(records))
+
+
+if __name__ == "__main__":
+    unittest.main()
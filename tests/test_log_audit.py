@@ -0,0 +1,133 @@
+"""
+Tests for log fetching and hashing in log_audit, against a fake
+w3.eth.get_logs instead of a live provider.
+"""
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+HAS_DEPS = all(importlib.util.find_spec(m) is not None for m in ("web3", "eth_hash", "requests"))
+
+if HAS_DEPS:
+    import requests
+    from eth_hash.auto import keccak
+
+    import log_audit  # noqa: E402
+
+
+def make_log(block, tx_index=0, log_index=0):
+    return {
+        "address": "0x" + "11" * 20,
+        "blockNumber": block,
+        "transactionHash": bytes([block % 256]) * 32,
+        "transactionIndex": tx_index,
+        "logIndex": log_index,
+        "data": b"\x00\x01",
+        "topics": [b"\xaa" * 32],
+        "blockHash": b"\xff" * 32,
+        "removed": False,
+    }
+
+
+class FakeW3:
+    """Returns one log per block in the requested range; `errors` are raised
+    by the first calls, in order."""
+
+    def __init__(self, errors=()):
+        self.calls = []
+        self.errors = list(errors)
+        self.eth = SimpleNamespace(get_logs=self.get_logs)
+        self.provider = SimpleNamespace(endpoint_uri="http://fake")
+
+    def get_logs(self, flt):
+        self.calls.append((flt["fromBlock"], flt["toBlock"]))
+        if self.errors:
+            raise self.errors.pop(0)
+        # Newest first, so fetch_logs has to sort.
+        return [make_log(b) for b in range(flt["toBlock"], flt["fromBlock"] - 1, -1)]
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} Client Error", response=response)
+
+
+@unittest.skipUnless(HAS_DEPS, "web3/eth_hash are not installed")
+class FetchLogsTest(unittest.TestCase):
+    def test_shard_boundaries(self) -> None:
+        for from_block, to_block, shard, expected in [
+            (100, 109, 5, [(100, 104), (105, 109)]),
+            (100, 110, 5, [(100, 104), (105, 109), (110, 110)]),
+            (7, 7, 1000, [(7, 7)]),
+        ]:
+            with self.subTest(from_block=from_block, to_block=to_block, shard=shard):
+                w3 = FakeW3()
+                logs = log_audit.fetch_logs(w3, from_block, to_block, "*", "*", shard=shard)
+                self.assertEqual(sorted(w3.calls), expected)
+                self.assertEqual([l.blockNumber for l in logs], list(range(from_block, to_block + 1)))
+
+    def test_retries_rate_limits_with_backoff(self) -> None:
+        for error in [http_error(429), ValueError({"code": -32005, "message": "Rate limit exceeded"})]:
+            with self.subTest(error=error):
+                w3 = FakeW3(errors=[error, error])
+                with mock.patch.object(log_audit.time, "sleep") as sleep:
+                    logs = log_audit.fetch_logs(w3, 1, 3, "*", "*")
+                self.assertEqual(len(logs), 3)
+                self.assertEqual(len(w3.calls), 3)
+                base = log_audit.BACKOFF_BASE_S
+                self.assertEqual([c.args[0] for c in sleep.call_args_list], [base, base * 2])
+
+    def test_gives_up_after_max_retries(self) -> None:
+        w3 = FakeW3(errors=[http_error(429)] * (log_audit.MAX_RETRIES + 1))
+        with mock.patch.object(log_audit.time, "sleep"), mock.patch("builtins.print"):
+            self.assertEqual(log_audit.fetch_logs(w3, 1, 3, "*", "*"), [])
+        self.assertEqual(len(w3.calls), log_audit.MAX_RETRIES + 1)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        for error in [
+            http_error(500),
+            ValueError("failed to generate filter"),
+            ValueError("query returned more than 10000 results"),
+        ]:
+            with self.subTest(error=error):
+                w3 = FakeW3(errors=[error])
+                with mock.patch.object(log_audit.time, "sleep") as sleep, mock.patch("builtins.print"):
+                    self.assertEqual(log_audit.fetch_logs(w3, 1, 3, "*", "*"), [])
+                self.assertEqual(len(w3.calls), 1)
+                sleep.assert_not_called()
+
+
+@unittest.skipUnless(HAS_DEPS, "web3/eth_hash are not installed")
+class KeccakLogsTest(unittest.TestCase):
+    def reference(self, logs):
+        """The original hash: the whole list serialized in one go."""
+        data = json.dumps([l._asdict() for l in logs], sort_keys=True, separators=(",", ":")).encode()
+        return "0x" + keccak(data).hex()
+
+    def test_matches_whole_list_hash(self) -> None:
+        logs = [log_audit.canonical_log(make_log(b, i % 3, i)) for i, b in enumerate(range(10, 30))]
+        for case in [[], logs[:1], logs]:
+            with self.subTest(n=len(case)):
+                self.assertEqual(log_audit.keccak_logs(case), self.reference(case))
+                memo = {}
+                self.assertEqual(log_audit.keccak_logs(case, memo), self.reference(case))
+                self.assertEqual(log_audit.keccak_logs(case, memo), self.reference(case))
+
+    def test_compare_logs_roots(self) -> None:
+        logs_a = [log_audit.canonical_log(make_log(b)) for b in range(5)]
+        logs_b = logs_a[:2] + [logs_a[2]._replace(data="0x02")] + logs_a[3:]
+        ok, diff = log_audit.compare_logs(logs_a, logs_b)
+        self.assertFalse(ok)
+        self.assertEqual((diff["rootA"], diff["rootB"]), (self.reference(logs_a), self.reference(logs_b)))
+        self.assertEqual(diff["firstDiff"]["index"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Regression tests for text-log field extraction.
+
+The text reader must extract exactly what the original three independent
+searches per line did.
+"""
+import itertools
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import consistency_audit_cli as cli  # noqa: E402
+
+
+def reference_records(path, regex_ts, regex_id, regex_state):
+    """The original per-line extraction: three separate searches."""
+    re_ts = re.compile(regex_ts) if regex_ts else None
+    re_id = re.compile(regex_id)
+    re_state = re.compile(regex_state)
+
+    out = []
+    with path.open("r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.rstrip("\n")
+            m_id = re_id.search(line)
+            m_state = re_state.search(line)
+            if not m_id or not m_state:
+                continue
+            id_value = m_id.groupdict().get("id") or m_id.group(1)
+            state = m_state.groupdict().get("state") or m_state.group(1)
+            ts_raw = None
+            if re_ts is not None:
+                m_ts = re_ts.search(line)
+                if m_ts:
+                    ts_raw = m_ts.groupdict().get("ts") or m_ts.group(0)
+            out.append((line_no, line, id_value, state, ts_raw))
+    return out
+
+
+TS_PATTERNS = [
+    None,
+    r"^(?P<ts>\S+)",
+    r"(?P<ts>\d{4}-\d{2}-\d{2}T[0-9:]+Z)",
+    r"ts=(?P<ts>[^,]+)",
+    r"(?P<ts>\S+)\s+id",
+]
+
+ID_PATTERNS = [
+    r"id=(?P<id>\w+)",
+    r"id=(?P<id>[^,]+)",
+    r"id=(?P<id>.{3})",
+    r"id=(?P<id>.)",
+    r"id=\s*(?P<id>\w+)",
+]
+
+STATE_PATTERNS = [
+    r"state=(?P<state>\w+)",
+    r"state=(?P<state>[^,]+)",
+    r"state=(?P<state>\w+)$",
+    r"state=\s*(?P<state>\w*)",
+]
+
+CONTENTS = {
+    "plain": (
+        "2024-01-01T00:00:00Z id=abc state=NEW\n"
+        "2024-01-01T00:00:01Z id=abc state=RUNNING\n"
+        "2024-01-01T00:00:02Z id=xyz state=DONE\n"
+    ),
+    "reordered_fields": (
+        "state=NEW id=abc 2024-01-01T00:00:00Z\n"
+        "id=abc 2024-01-01T00:00:01Z state=DONE\n"
+        "ts=2024-01-01T00:00:02Z,state=NEW,id=q\n"
+    ),
+    "optional_timestamps": (
+        "id=abc state=NEW\n"
+        "2024-01-01T00:00:01Z id=abc state=RUNNING\n"
+        "noise line without fields\n"
+        "id=only-id\n"
+        "state=ONLY\n"
+        "id=abc state=DONE\n"
+    ),
+    "cross_line_classes": (
+        "ts=2024-01-01T00:00:00Z,id=abc,state=NEW\n"
+        "ts=2024-01-01T00:00:01Z,id=abc,state=\n"
+        "RUNNING next line\n"
+        "id=\n"
+        "xyz state=DONE\n"
+        "id=abc state=RUNNING, trailing\n"
+    ),
+    "no_trailing_newline": (
+        "2024-01-01T00:00:00Z id=abc state=NEW\n"
+        "2024-01-01T00:00:01Z id=abc state=DONE"
+    ),
+    "non_ascii": (
+        "2024-01-01T00:00:00Z id=éab state=NEW\n"
+        "2024-01-01T00:00:01Z id=日本語x state=DONE\n"
+        "2024-01-01T00:00:02Z id=abc state=NÉW\n"
+        "2024-01-01T00:00:03Z id=café state=NEW\n"
+        "2024-01-01T00:00:04Z id=日本 state=DONE\n"
+    ),
+    "separator_chars": (
+        "2024-01-01T00:00:00Z\x1cid=abc state=NEW\n"
+        "2024-01-01T00:00:01Z id=abc\x1fstate=DONE\n"
+    ),
+    "crlf": (
+        "2024-01-01T00:00:00Z id=abc state=NEW\r\n"
+        "2024-01-01T00:00:01Z id=abc state=DONE\r\n"
+    ),
+    "empty": "",
+}
+
+
+class TextExtractionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def write(self, name: str, content: str) -> Path:
+        path = self.tmp / f"{name}.log"
+        with path.open("w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        return path
+
+    def test_reader_matches_reference(self) -> None:
+        paths = {name: self.write(name, content) for name, content in CONTENTS.items()}
+        combos = itertools.product(TS_PATTERNS, ID_PATTERNS, STATE_PATTERNS, paths.items())
+
+        for regex_ts, regex_id, regex_state, (name, path) in combos:
+            with self.subTest(ts=regex_ts, id=regex_id, state=regex_state, content=name):
+                expected = reference_records(path, regex_ts, regex_id, regex_state)
+
+                re_ts = cli.compile_optional(regex_ts)
+                re_id = cli.compile_optional(regex_id)
+                re_state = cli.compile_optional(regex_state)
+                searched = list(cli._iter_searched_lines(path, re_ts, re_id, re_state))
+                self.assertEqual(searched, expected)
+
+    def test_iter_text_records_matches_reference(self) -> None:
+        path = self.write("mixed", "".join(CONTENTS.values()))
+        cases = [
+            (r"^(?P<ts>\S+)", r"id=(?P<id>\w+)", r"state=(?P<state>\w+)"),
+            (r"^\S+", r"id=(\w+)", r"state=(\w+)"),
+            (None, r"id=(?P<id>(\w)\w*)", r"state=(?P<state>\w+)"),
+            (r"(?P<ts>\S+)", r"(?P<id>i)d=(?P=id)?\w+", r"(?i)STATE=(?P<state>\w+)"),
+        ]
+        for regex_ts, regex_id, regex_state in cases:
+            with self.subTest(ts=regex_ts, id=regex_id, state=regex_state):
+                expected = [
+                    (str(path), n, i, s, t, line)
+                    for n, line, i, s, t in reference_records(path, regex_ts, regex_id, regex_state)
+                    if i is not None and s is not None
+                ]
+                records = cli.iter_text_records([path], regex_ts, regex_id, regex_state, keep_raw=True)
+                self.assertEqual(list(records), expected)
+
+    def test_non_ascii_word_ids(self) -> None:
+        path = self.write("words", "id=café state=NEW\nid=日本 state=NEW\n")
+        records = cli.iter_text_records([path], None, r"id=(?P<id>\w+)", r"state=(?P<state>\w+)")
+        self.assertEqual([r[2] for r in records], ["café", "日本"])
+
+
+if __name__ == "__main__":
+    unittest.main()